@@ -7,83 +7,112 @@ This module provides functions to:
 - List available sources and files
 - Load the `elements.json` periodic table lookup used throughout pyMKM
 
-All file paths are resolved using :mod:`importlib.resources`, making them portable
-within installed packages or local development environments.
+All file paths are resolved exclusively through :func:`importlib.resources.files`, making
+them portable across installed packages, zipped wheels and local development environments.
 """
 
 import os
 import json
-import importlib.util
-from typing import List, Dict
-from pathlib import Path
+import functools
+from importlib.resources import files
+from types import MappingProxyType
+from typing import Any, Iterator, List, Mapping, Tuple
 
+try:
+    # Optional faster JSON parser; the stdlib decoder is used when unavailable
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
 
+
+@functools.lru_cache(maxsize=None)
 def get_default_txt_path(source: str, filename: str) -> str:
     """
     Locate a default .txt file for a given source and filename.
 
-    Tries first to resolve the file within the installed package.
-    Falls back to a local relative path (for development use) if needed.
+    The file is resolved within the `pymkm.data.defaults.<source>` package via
+    :func:`importlib.resources.files`. Successful lookups are cached per process.
 
-    :param source: The name of the data subdirectory (e.g., "ions").
+    :param source: The name of the data subdirectory (e.g., "mstar_3_12").
     :type source: str
     :param filename: The name of the .txt file to locate.
     :type filename: str
 
-    :returns: Absolute path to the located file.
+    :returns: Path to the located file.
     :rtype: str
 
-    :raises FileNotFoundError: If the file cannot be found in either location.
+    :raises FileNotFoundError: If the source package or the file cannot be found.
     """
     try:
-        # Attempt to locate installed package data
-        spec = importlib.util.find_spec(f"pymkm.data.defaults.{source}")
-        if spec is not None and spec.origin is not None:
-            base_dir = os.path.dirname(spec.origin)
-            full_path = os.path.join(base_dir, filename)
-            if os.path.exists(full_path):
-                return full_path
-    except Exception:
+        path = files(f"pymkm.data.defaults.{source}").joinpath(filename)
+        if path.is_file():
+            return str(path)
+    except (ModuleNotFoundError, TypeError):
+        # Unknown source, or a name resolving to a module rather than a package
         pass
 
-    # Local fallback (e.g. during development)
-    local = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), "..", "data", "defaults", source, filename)
-    )
-    if os.path.exists(local):
-        return local
-
     raise FileNotFoundError(f"Cannot find file '{filename}' for source '{source}'")
 
 
+def _iter_entries(folder: Any) -> Iterator[Any]:
+    """
+    Iterate over the entries of a resource folder.
+
+    On-disk folders (any :class:`os.PathLike`) are walked with :func:`os.scandir`, whose
+    ``DirEntry`` objects expose ``name`` and ``is_dir()`` without an extra ``stat`` per entry.
+    Other traversables (e.g. resources inside a zipped wheel) fall back to ``iterdir()``.
+
+    :param folder: Directory path or :class:`importlib.resources.abc.Traversable`.
+    :type folder: os.PathLike or Traversable
+
+    :returns: Iterator of entries providing ``name`` and ``is_dir()``.
+    :rtype: Iterator
+    """
+    if isinstance(folder, os.PathLike):
+        with os.scandir(folder) as it:
+            yield from it
+    else:
+        yield from folder.iterdir()
+
+
 def get_available_sources() -> List[str]:
     """
     List all available data sources within the default data registry.
 
     Looks for subdirectories under `pymkm.data.defaults` corresponding to different source categories.
+    The registry is scanned only once per process; subsequent calls return the cached result.
 
     :returns: List of source names (subdirectory names).
     :rtype: list[str]
 
+    :raises FileNotFoundError: If the base directory cannot be located.
+    """
+    return list(_scan_sources())
+
+
+@functools.lru_cache(maxsize=1)
+def _scan_sources() -> Tuple[str, ...]:
+    """
+    Scan `pymkm.data.defaults` for source subdirectories.
+
+    Cached helper behind :func:`get_available_sources`. Call ``_scan_sources.cache_clear()``
+    to force a new scan (e.g. after adding a source folder at runtime).
+
+    :returns: Tuple of source names (subdirectory names).
+    :rtype: tuple[str, ...]
+
     :raises FileNotFoundError: If the base directory cannot be located.
     """
     try:
-        from importlib.resources import files
         base = files("pymkm.data.defaults")
-        candidates = base.iterdir()
-    except Exception:
-        spec = importlib.util.find_spec("pymkm.data.defaults")
-        if spec and spec.origin:
-            folder_path = Path(spec.origin).parent
-            candidates = folder_path.iterdir()
-        else:
-            raise FileNotFoundError("Could not locate default sources.")
-
-    return [
+    except ModuleNotFoundError as e:
+        raise FileNotFoundError("Could not locate default sources.") from e
+
+    return tuple(
         f.name
-        for f in candidates
-        if f.is_dir() and not f.name.startswith(("__", "."))
-    ]
+        for f in _iter_entries(base)
+        if not f.name.startswith(("__", ".")) and f.is_dir()
+    )
 
 
 def list_available_defaults(source: str) -> List[str]:
@@ -101,39 +130,26 @@ def list_available_defaults(source: str) -> List[str]:
     :raises FileNotFoundError: If the source folder or .txt files cannot be located.
     """
     try:
-        from importlib.resources import files
         folder = files(f"pymkm.data.defaults.{source}")
-        return [f.name for f in folder.iterdir() if f.suffix == ".txt"]
-    except Exception:
-        spec = importlib.util.find_spec(f"pymkm.data.defaults.{source}")
-        if spec and spec.origin:
-            folder_path = Path(spec.origin).parent
-            return [f.name for f in folder_path.iterdir() if f.suffix == ".txt"]
-    raise FileNotFoundError(f"Could not locate txt files for source: {source}")
+        return [f.name for f in _iter_entries(folder) if f.name.endswith(".txt")]
+    except (ModuleNotFoundError, TypeError, FileNotFoundError, NotADirectoryError) as e:
+        raise FileNotFoundError(f"Could not locate txt files for source: {source}") from e
 
 
-def load_lookup_table() -> Dict[str, Dict]:
+@functools.lru_cache(maxsize=1)
+def load_lookup_table() -> Mapping[str, Mapping]:
     """
     Load the chemical elements lookup table from a JSON file.
 
-    Tries to load `elements.json` from the installed package, with a fallback
-    to a local relative file during development.
+    Reads `elements.json` from the `pymkm.data` package via :func:`importlib.resources.files`.
+    The file is parsed once per process (with :mod:`orjson` when installed, otherwise
+    :mod:`json`); the cached table and its per-element entries are returned as read-only mappings.
 
-    :returns: Dictionary mapping element symbols to their properties.
-    :rtype: dict[str, dict]
+    :returns: Read-only mapping of element names to read-only property mappings.
+    :rtype: Mapping[str, Mapping]
 
     :raises FileNotFoundError: If the elements.json file cannot be found.
     :raises json.JSONDecodeError: If the file content is not valid JSON.
     """
-    try:
-        from importlib.resources import files
-        path = files("pymkm.data").joinpath("elements.json")
-        with open(path, "r") as f:
-            return json.load(f)
-    except Exception:
-        # Fallback for local use
-        local_path = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "data", "elements.json")
-        )
-        with open(local_path, "r") as f:
-            return json.load(f)
\ No newline at end of file
+    data = files("pymkm.data").joinpath("elements.json").read_bytes()
+    return MappingProxyType({name: MappingProxyType(props) for name, props in _json_loads(data).items()})
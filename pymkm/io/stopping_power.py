@@ -29,13 +29,15 @@ array([1.0, 2.0, 3.0])
 from pathlib import Path
 import numpy as np
 import re
-import matplotlib.pyplot as plt
-from typing import Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
 import warnings
 
 from pymkm.io.data_registry import load_lookup_table
 from pymkm.utils.interpolation import Interpolator
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 # Always show warnings
 warnings.simplefilter("always", UserWarning)
 
@@ -54,16 +56,19 @@ class StoppingPowerTable:
     DEFAULT_TARGET = "WATER_LIQUID" 
 
     @classmethod
-    def get_lookup_table(cls) -> Dict[str, Dict[str, int]]:
+    def get_lookup_table(cls) -> Mapping[str, Mapping[str, Any]]:
         """
         Retrieve the ion properties lookup table used to resolve ion metadata.
     
         The table maps element names (e.g., "Carbon") to their symbol, atomic number,
         mass number, and display color. Based on IUPAC reference data from:
         https://ciaaw.org/atomic-weights.htm
+
+        The returned table is the shared, cached instance and is read-only; use
+        ``{k: dict(v) for k, v in table.items()}`` to obtain a mutable copy.
     
-        :returns: A dictionary with element names as keys and their properties as nested dictionaries.
-        :rtype: dict[str, dict[str, int]]
+        :returns: A read-only mapping with element names as keys and their properties as nested read-only mappings.
+        :rtype: Mapping[str, Mapping[str, Any]]
         """
         return load_lookup_table()
 
@@ -265,7 +270,7 @@ class StoppingPowerTable:
         self,
         label: Optional[str] = None,
         show: bool = True,
-        ax: Optional[plt.Axes] = None
+        ax: Optional["Axes"] = None
     ):
         """
         Plot stopping power (LET) as a function of energy.
@@ -278,6 +283,9 @@ class StoppingPowerTable:
         :type ax: Optional[matplotlib.axes.Axes]
         """
 
+        # Deferred import keeps matplotlib off the import path of pymkm
+        import matplotlib.pyplot as plt
+
         # Create figure/axes if not provided
         created_fig = False
         if ax is None:
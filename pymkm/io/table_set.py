@@ -28,13 +28,15 @@ Examples
 
 import json
 import os
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional
 import numpy as np
-import matplotlib.pyplot as plt
 
 from pymkm.io.stopping_power import StoppingPowerTable
 from pymkm.io.data_registry import list_available_defaults, get_default_txt_path
 
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
 
 class StoppingPowerTableSet:
     """
@@ -417,7 +419,7 @@ class StoppingPowerTableSet:
     def plot(self,
              ions: Optional[List[str]] = None,
              show: bool = True,
-             ax: Optional[plt.Axes] = None,
+             ax: Optional["Axes"] = None,
              single_plot: bool = True
         ):
         """
@@ -432,6 +434,9 @@ class StoppingPowerTableSet:
         :param single_plot: If True, plot all ions on one figure; otherwise, one figure per ion.
         :type single_plot: bool
         """
+        # Deferred import keeps matplotlib off the import path of pymkm
+        import matplotlib.pyplot as plt
+
         ions_to_plot = ions if ions is not None else list(self.tables.keys())    
 
         if single_plot:
@@ -8,9 +8,16 @@ for different ions.
 Plots include optional display of model configuration and geometry.
 """
 
-from typing import List, Optional, Union
-import matplotlib.pyplot as plt
-plt.rcParams.update({
+from typing import TYPE_CHECKING, List, Optional, Union
+import numpy as np
+
+from .core import MKTable
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# Plot style, applied only for the duration of each plot() call
+_RCPARAMS = {
     "axes.linewidth": 1.2,
     "axes.labelsize": 16,
     "xtick.labelsize": 14,
@@ -23,10 +30,18 @@ plt.rcParams.update({
     "ytick.major.size": 5,
     "legend.fontsize": 14,
     "axes.titlesize": 12
-})
-import numpy as np
+}
+
+_ALLOWED_X = frozenset({"energy", "let"})
+_ALLOWED_Y = frozenset({"z_bar_star_domain", "z_bar_domain", "z_bar_nucleus"})
+
+_X_LABELS = {"energy": "Energy [MeV/u]", "let": "LET [MeV/cm]"}
+_Y_LABELS = {
+    "z_bar_star_domain": r"$\bar{z}^{*}$ [Gy]",
+    "z_bar_domain": r"$\bar{z}_d$ [Gy]",
+    "z_bar_nucleus": r"$\bar{z}_n$ [Gy]"
+}
 
-from .core import MKTable
 
 def _validate_plot_columns(x: str, y: str):
     """
@@ -39,12 +54,10 @@ def _validate_plot_columns(x: str, y: str):
     
     :raises ValueError: If x or y are not among the allowed options.
     """
-    allowed_x = {"energy", "let"}
-    allowed_y = {"z_bar_star_domain", "z_bar_domain", "z_bar_nucleus"}
-    if x not in allowed_x:
-        raise ValueError(f"Invalid x-axis: '{x}'. Allowed values are: {sorted(allowed_x)}")
-    if y not in allowed_y:
-        raise ValueError(f"Invalid y-axis: '{y}'. Allowed values are: {sorted(allowed_y)}")
+    if x not in _ALLOWED_X:
+        raise ValueError(f"Invalid x-axis: '{x}'. Allowed values are: {sorted(_ALLOWED_X)}")
+    if y not in _ALLOWED_Y:
+        raise ValueError(f"Invalid y-axis: '{y}'. Allowed values are: {sorted(_ALLOWED_Y)}")
 
 
 def plot(
@@ -54,7 +67,7 @@ def plot(
     x: str = "energy",
     y: str = "z_bar_star_domain",
     verbose: bool = False,
-    ax: Optional[plt.Axes] = None,
+    ax: Optional["Axes"] = None,
     show: Optional[bool] = True,
     title: Optional[bool] = False
 ):
@@ -85,71 +98,69 @@ def plot(
     ions = ions or self.sp_table_set.get_available_ions()
     ions = [self.sp_table_set._map_to_fullname(ion) for ion in ions]
     _validate_plot_columns(x, y)
-
-    x_label_map = {"energy": "Energy [MeV/u]", "let": "LET [MeV/cm]"}
-    y_label_map = {
-        "z_bar_star_domain": r"$\bar{z}^{*}$ [Gy]",
-        "z_bar_domain": r"$\bar{z}_d$ [Gy]",
-        "z_bar_nucleus": r"$\bar{z}_n$ [Gy]"
-    }
-
-    # Create figure/axes if not provided
-    created_fig = False
-    if ax is None:
-        _, ax = plt.subplots()
-        created_fig = True
-
-    x_min, x_max, y_max = np.inf, -np.inf, -np.inf
-    for ion in ions:
-        df = self.table[ion]["data"]
-        x_vals = df[x].values
-        y_vals = df[y].values
-        x_min = min(x_min, x_vals.min())
-        x_max = max(x_max, x_vals.max())
-        y_max = max(y_max, y_vals.max())
-
-    for ion in ions:
-        df = self.table[ion]["data"]
-        ion_symbol = self.sp_table_set.get(ion).ion_symbol
-        color = self.sp_table_set.get(ion).color
-        ax.plot(df[x], df[y], label=ion_symbol, color=color, alpha=0.5, linewidth=6)
-
-    plot_title = f"Source: {self.sp_table_set.source_info}, Track model: {self.params.model_name} (Core: {self.params.core_radius_type})"
-
-    ax.set_xlabel(x_label_map.get(x, x.capitalize()))
-    ax.set_ylabel(y_label_map.get(y, y.replace('_', ' ').capitalize()))
-    if title:
-        plot_title = f"Source: {self.sp_table_set.source_info}, Track model: {self.params.model_name} (Core: {self.params.core_radius_type})"
-        ax.set_title(plot_title, wrap=True)
-    ax.set_xscale("log" if x == "energy" else "linear")
-    ax.set_xlim(x_min, x_max)
-    ax.set_ylim(0, y_max * 1.05)
-    ax.grid(True, which='both', linestyle='--', alpha=0.1)
-    ax.legend()
-
-    if verbose:
-        param_dict = vars(self.params)
-        main_parameters = [
-            (r"$r_d$", param_dict["domain_radius"], "μm"),
-            (r"$R_n$", param_dict["nucleus_radius"], "μm"),
-        ]
-        if param_dict.get("z0") is not None:
-            main_parameters.append((r"$z_0$", param_dict["z0"], "Gy"))
-        if param_dict.get("beta0") is not None:
-            main_parameters.append((r"$\beta_0$", param_dict["beta0"], "Gy⁻²"))
-
-        info_lines = [f"Model: {self.model_version}"] + [
-            f"{k}: {v:.3f} {unit}" for k, v, unit in main_parameters
-        ]
-        info_text = "\n".join(info_lines)
-
-        ax.text(0.05, 0.05, info_text, transform=ax.transAxes,
-                fontsize=14, verticalalignment='bottom', horizontalalignment='left',
-                bbox=dict(facecolor='white', alpha=0.85, edgecolor='black', boxstyle='round'))
-
-    if show and created_fig:
-        plt.tight_layout()
-        plt.show()
+    # Deferred import keeps matplotlib off the import path of pymkm.mktable
+    import matplotlib.pyplot as plt
+
+    with plt.rc_context(_RCPARAMS):
+        # Create figure/axes if not provided
+        fig = None
+        if ax is None:
+            fig, ax = plt.subplots()
+
+        # Resolve stopping power tables once, then plot and track axis ranges in a single pass
+        resolved = [(ion, self.sp_table_set.get(ion)) for ion in ions]
+        x_min, x_max, y_max = np.inf, -np.inf, -np.inf
+        for ion, sp_table in resolved:
+            df = self.table[ion]["data"]
+            x_vals = df[x].to_numpy()
+            y_vals = df[y].to_numpy()
+            if x == "energy":
+                # Log-scaled axis: drop non-positive energies once instead of letting matplotlib mask them
+                positive = x_vals > 0
+                x_vals, y_vals = x_vals[positive], y_vals[positive]
+                if x_vals.size == 0:
+                    continue
+            x_min = min(x_min, x_vals.min())
+            x_max = max(x_max, x_vals.max())
+            y_max = max(y_max, y_vals.max())
+            ax.plot(x_vals, y_vals, label=sp_table.ion_symbol, color=sp_table.color, alpha=0.5, linewidth=6)
+
+        ax.set_xlabel(_X_LABELS.get(x, x.capitalize()))
+        ax.set_ylabel(_Y_LABELS.get(y, y.replace('_', ' ').capitalize()))
+        if title:
+            plot_title = f"Source: {self.sp_table_set.source_info}, Track model: {self.params.model_name} (Core: {self.params.core_radius_type})"
+            ax.set_title(plot_title, wrap=True)
+        ax.set_xscale("log" if x == "energy" else "linear")
+        if np.isfinite(x_min):
+            # Ranges stay at ±inf when every point was masked out; keep matplotlib's defaults then
+            ax.set_xlim(x_min, x_max)
+            ax.set_ylim(0, y_max * 1.05)
+        ax.grid(True, which='both', linestyle='--', alpha=0.1)
+        ax.legend()
+
+        if verbose:
+            param_dict = vars(self.params)
+            main_parameters = [
+                (r"$r_d$", param_dict["domain_radius"], "μm"),
+                (r"$R_n$", param_dict["nucleus_radius"], "μm"),
+            ]
+            if param_dict.get("z0") is not None:
+                main_parameters.append((r"$z_0$", param_dict["z0"], "Gy"))
+            if param_dict.get("beta0") is not None:
+                main_parameters.append((r"$\beta_0$", param_dict["beta0"], "Gy⁻²"))
+
+            info_lines = [f"Model: {self.model_version}"] + [
+                f"{k}: {v:.3f} {unit}" for k, v, unit in main_parameters
+            ]
+            info_text = "\n".join(info_lines)
+
+            ax.text(0.05, 0.05, info_text, transform=ax.transAxes,
+                    fontsize=14, verticalalignment='bottom', horizontalalignment='left',
+                    bbox=dict(facecolor='white', alpha=0.85, edgecolor='black', boxstyle='round'))
+
+        if show and fig is not None:
+            fig.tight_layout()
+            plt.show()
 
 
 MKTable.plot = plot
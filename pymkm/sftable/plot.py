@@ -8,8 +8,14 @@ Plots are displayed as semilogarithmic survival vs. dose curves. The method also
 supports filtering by LET and displaying model parameters as annotations.
 """
 
-import matplotlib.pyplot as plt
-plt.rcParams.update({
+from typing import TYPE_CHECKING, Optional
+from .core import SFTable
+
+if TYPE_CHECKING:
+    from matplotlib.axes import Axes
+
+# Plot style, applied only for the duration of each plot() call
+_RCPARAMS = {
     "axes.linewidth": 1.2,
     "axes.labelsize": 16,
     "xtick.labelsize": 14,
@@ -21,15 +27,14 @@ plt.rcParams.update({
     "xtick.major.size": 5,
     "ytick.major.size": 5,
     "legend.fontsize": 14
-})
-from typing import Optional
-from .core import SFTable
+}
+
 
 def plot(self,
          *,
          verbose: Optional[bool] = False,
          let: Optional[float] = None,
-         ax: Optional[plt.Axes] = None,
+         ax: Optional["Axes"] = None,
          show: Optional[bool] = True
 ):
     """
@@ -61,64 +66,69 @@ def plot(self,
     else:
         results_to_plot = results
 
-    for idx, result in enumerate(results_to_plot):
-        params = result.get("params", {})
-        calc_info = result.get("calculation_info", "N/A")
-        df = result.get("data")
-
-        if df is None or df.empty:
-            print(f"\u26a0\ufe0f No data in result {idx + 1}.")
-            continue
-
-        ion = params.get("ion", "N/A")
-        energy = params.get("energy", "N/A")
-        let_val = params.get("let", "N/A")
-        model = params.get("model", "N/A")
-
-        color = self.params.mktable.sp_table_set.get(ion).color
-
-        # Create figure/axes if not provided
-        created_fig = False
-        if ax is None:
-            _, ax = plt.subplots()
-            created_fig = True
-
-        ax.plot(df["dose"], df["survival_fraction"],
-                 label=f"{ion} | E={energy} MeV/u",
-                 color=color, alpha=0.5, linewidth=6)
-
-        ax.set_xlabel("Dose [Gy]", fontsize=14)
-        ax.set_ylabel("Survival fraction", fontsize=14)
-        ax.set_title(f"Survival Curve\nLET = {let_val} MeV/cm | Model: {model}", fontsize=16)
-        ax.grid(True, linestyle='--', alpha=0.5)
-        ax.set_xlim(left=0)
-        ax.set_ylim(top=1)
-        ax.set_yscale("log")
-        ax.legend()
-
-        if verbose and idx == 0:
-            alpha0 = self.params.alpha0
-            beta0 = self.params.beta0
-            osmk_info = ""
-            osmk_version = params.get("osmk_version")
-            if osmk_version:
-                pO2 = self.params.pO2
-                osmk_info = f"\nOSMK: {osmk_version}, pO₂: {pO2:.2f} mmHg"
+    # Deferred import keeps matplotlib off the import path of pymkm.sftable
+    import matplotlib.pyplot as plt
+
+    with plt.rc_context(_RCPARAMS):
+        for idx, result in enumerate(results_to_plot):
+            params = result.get("params", {})
+            calc_info = result.get("calculation_info", "N/A")
+            df = result.get("data")
+
+            if df is None or df.empty:
+                print(f"\u26a0\ufe0f No data in result {idx + 1}.")
+                continue
+
+            ion = params.get("ion", "N/A")
+            energy = params.get("energy", "N/A")
+            let_val = params.get("let", "N/A")
+            model = params.get("model", "N/A")
+
+            color = self.params.mktable.sp_table_set.get(ion).color
+
+            # Create figure/axes if not provided
+            created_fig = False
+            if ax is None:
+                _, ax = plt.subplots()
+                created_fig = True
+
+            ax.plot(df["dose"], df["survival_fraction"],
+                     label=f"{ion} | E={energy} MeV/u",
+                     color=color, alpha=0.5, linewidth=6)
+
+            ax.set_xlabel("Dose [Gy]", fontsize=14)
+            ax.set_ylabel("Survival fraction", fontsize=14)
+            ax.set_title(f"Survival Curve\nLET = {let_val} MeV/cm | Model: {model}", fontsize=16)
+            ax.grid(True, linestyle='--', alpha=0.5)
+            ax.set_xlim(left=0)
+            ax.set_ylim(top=1)
+            ax.set_yscale("log")
+            ax.legend()
+
+            if verbose and idx == 0:
+                alpha0 = self.params.alpha0
+                beta0 = self.params.beta0
+                osmk_info = ""
+                osmk_version = params.get("osmk_version")
+                if osmk_version:
+                    pO2 = self.params.pO2
+                    osmk_info = f"\nOSMK: {osmk_version}, pO₂: {pO2:.2f} mmHg"
         
-            info_text = (
-                f"Model: {model}\n"
-                f"α₀: {alpha0:.3f} Gy⁻¹\n"
-                f"β₀: {beta0:.3f} Gy⁻²\n"
-                f"Calculation: {calc_info}"
-                f"{osmk_info}"
-            )
-
-            ax.text(0.05, 0.05, info_text, transform=ax.transAxes,
-                    fontsize=12, verticalalignment='bottom', horizontalalignment='left',
-                    bbox=dict(facecolor='white', alpha=0.8, edgecolor='black', boxstyle='round'))
-
-        if show and created_fig:
-            plt.tight_layout()
-            plt.show()
+                info_text = (
+                    f"Model: {model}\n"
+                    f"α₀: {alpha0:.3f} Gy⁻¹\n"
+                    f"β₀: {beta0:.3f} Gy⁻²\n"
+                    f"Calculation: {calc_info}"
+                    f"{osmk_info}"
+                )
+
+                ax.text(0.05, 0.05, info_text, transform=ax.transAxes,
+                        fontsize=12, verticalalignment='bottom', horizontalalignment='left',
+                        bbox=dict(facecolor='white', alpha=0.8, edgecolor='black', boxstyle='round'))
+
+            if show and created_fig:
+                plt.tight_layout()
+                plt.show()
+
 
 SFTable.plot = plot
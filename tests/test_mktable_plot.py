@@ -142,3 +142,29 @@ def test_plot_with_title_sets_title(fast_computed_mktable):
     
     assert ax.get_title() != "", "Title was expected to be set but was empty"
     plt.close(fig)
+
+@pytest.mark.filterwarnings("ignore:FigureCanvasAgg is non-interactive.*")
+@pytest.mark.filterwarnings("ignore:Attempting to set identical low and high xlims.*")
+def test_plot_energy_drops_non_positive_values(fast_computed_mktable):
+    """Test that non-positive energies are excluded from the log-scaled x-axis."""
+    df = fast_computed_mktable.table["Carbon"]["data"]
+    df.loc[df.index[0], "energy"] = 0.0
+    fig, ax = plt.subplots()
+    fast_computed_mktable.plot(x="energy", y="z_bar_star_domain", ax=ax, show=False)
+
+    assert ax.get_xlim()[0] > 0
+    assert np.all(ax.get_lines()[0].get_xdata() > 0)
+    plt.close(fig)
+
+@pytest.mark.filterwarnings("ignore:FigureCanvasAgg is non-interactive.*")
+@pytest.mark.filterwarnings("ignore:No artists with labels found.*")
+def test_plot_energy_all_non_positive_values(fast_computed_mktable):
+    """Test that plotting does not fail when every energy is masked out on the log axis."""
+    df = fast_computed_mktable.table["Carbon"]["data"]
+    df["energy"] = 0.0
+    fig, ax = plt.subplots()
+    fast_computed_mktable.plot(x="energy", y="z_bar_star_domain", ax=ax, show=False)
+
+    assert ax.get_lines() == []
+    assert np.all(np.isfinite(ax.get_xlim()))
+    plt.close(fig)